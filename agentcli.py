@@ -4,6 +4,7 @@ AgentCLI - A command-line interface for running AI agents
 """
 
 import argparse
+import json
 import os
 import sys
 from rich.console import Console
@@ -16,6 +17,12 @@ from agents.file_agent import FileAgent
 from agents.summarizer_agent import SummarizerAgent
 from agents.reminder_agent import ReminderAgent
 from agents.tutor_agent import TutorAgent
+from core.semantic_cache import SemanticCache
+from core.file_loader import load_document
+from core.fan_out import run_concurrently
+from core.model_client import GeminiModelClient
+from core.embedding_client import HashingEmbeddingClient
+from agents.embedding_agent import EmbeddingAgent
 
 def get_agent_class(agent_name):
     agents = {
@@ -33,6 +40,40 @@ def log_to_file(message):
     with open("logs/agentcli.log", "a") as f:
         f.write(message + "\n")
 
+def run_pipeline(agent_names, file_path, level='beginner', client=None):
+    """
+    Run several agents on one file: the document is loaded once, one model
+    client is shared, and the model calls go out concurrently.
+    Returns all results as a single JSON document.
+    """
+    if not agent_names:
+        raise ValueError("No agent names given")
+    agent_classes = {name: get_agent_class(name) for name in agent_names}
+    content = load_document(file_path)
+    client = client or GeminiModelClient()
+    tasks = {}
+    for name, agent_class in agent_classes.items():
+        if not hasattr(agent_class, 'run'):
+            raise ValueError(f"{name} does not support 'run'. Use 'ask' instead.")
+        if name == 'TutorAgent':
+            agent = agent_class(file_path=file_path, content=content, level=level, client=client)
+        else:
+            agent = agent_class(file_path=file_path, content=content, client=client)
+        tasks[name] = agent.run
+
+    outcomes = run_concurrently(tasks)
+    errors = [o["error"] for o in outcomes.values() if o["error"]]
+    if len(errors) == len(outcomes):
+        raise Exception(errors[0])
+    structured = {
+        "file": file_path,
+        "agents": {
+            name: {"result": o["result"], "error": o["error"], "seconds": round(o["seconds"], 3)}
+            for name, o in outcomes.items()
+        },
+    }
+    return json.dumps(structured, indent=2, ensure_ascii=False)
+
 def main():
     console = Console()
     
@@ -48,8 +89,8 @@ def main():
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Run command
-    run_parser = subparsers.add_parser('run', help='Run an agent on a file')
-    run_parser.add_argument('agent_name', help='Name of the agent to run')
+    run_parser = subparsers.add_parser('run', help='Run one or more agents on a file')
+    run_parser.add_argument('agent_name', nargs='+', help='Agent(s) to run; several names (or a comma-separated list) run concurrently on one load of the file')
     run_parser.add_argument('--file', required=True, help='Path to the file to process')
     run_parser.add_argument('--level', default='beginner', help='Level for TutorAgent (beginner, intermediate, advanced)')
     run_parser.add_argument('--output', help='Output file to save results')
@@ -60,6 +101,12 @@ def main():
     ask_parser.add_argument('question', help='Question to ask the agent')
     ask_parser.add_argument('--file', required=True, help='Path to the file to query')
     ask_parser.add_argument('--output', help='Output file to save results')
+    ask_parser.add_argument('--cache', action='store_true', help='Reuse answers to near-duplicate questions (FileAgent)')
+    ask_parser.add_argument('--cache-path', default='logs/semantic_cache.json', help='Where the semantic cache is stored')
+    ask_parser.add_argument('--cache-threshold', type=float, default=0.9, help='Minimum question similarity for a cache hit')
+    ask_parser.add_argument('--cache-ttl', type=float, default=7 * 24 * 3600, help='Seconds before a cached answer expires')
+    ask_parser.add_argument('--cache-size', type=int, default=256, help='Maximum number of cached answers (LRU)')
+    ask_parser.add_argument('--cache-embedder', choices=['gemini', 'local'], default='gemini', help="Question embeddings: Gemini API or offline hashing ('local')")
     
     args = parser.parse_args()
     
@@ -68,16 +115,36 @@ def main():
         return
     
     try:
-        agent_class = get_agent_class(args.agent_name)
-        
         if args.command == 'run':
-            if args.agent_name == 'TutorAgent':
-                agent = agent_class(file_path=args.file, level=args.level)
+            agent_names = list(dict.fromkeys(n.strip() for a in args.agent_name for n in a.split(',') if n.strip()))
+            if len(agent_names) == 1:
+                agent_class = get_agent_class(agent_names[0])
+                if agent_names[0] == 'TutorAgent':
+                    agent = agent_class(file_path=args.file, level=args.level)
+                else:
+                    agent = agent_class(file_path=args.file)
+                result = agent.run()
             else:
-                agent = agent_class(file_path=args.file)
-            result = agent.run()
+                result = run_pipeline(agent_names, args.file, args.level)
         elif args.command == 'ask':
-            agent = agent_class(file_path=args.file)
+            agent_class = get_agent_class(args.agent_name)
+            cache = None
+            if args.cache:
+                if agent_class is not FileAgent:
+                    raise ValueError("--cache is only supported for FileAgent")
+                embed_agent = None
+                if args.cache_embedder == 'local':
+                    embed_agent = EmbeddingAgent(client=HashingEmbeddingClient(), model="local-hashing")
+                cache = SemanticCache(
+                    embed_agent=embed_agent,
+                    threshold=args.cache_threshold,
+                    max_entries=args.cache_size,
+                    ttl_seconds=args.cache_ttl,
+                    path=args.cache_path,
+                )
+                agent = agent_class(file_path=args.file, cache=cache)
+            else:
+                agent = agent_class(file_path=args.file)
             result = agent.ask(args.question)
         
         # Print result
@@ -91,9 +158,14 @@ def main():
             print(f"Results saved to {args.output}")
         
         # Log to file
-        log_message = f"[{args.command}] {args.agent_name} on {args.file}"
+        agent_label = ", ".join(agent_names) if args.command == 'run' else args.agent_name
+        log_message = f"[{args.command}] {agent_label} on {args.file}"
         if args.command == 'ask':
             log_message += f" - Question: {args.question}"
+            if cache is not None:
+                stats = cache.stats()
+                rprint(f"[dim]Cache: {stats['hits']} hits, {stats['misses']} misses, hit rate {stats['hit_rate']:.0%}[/dim]")
+                log_message += f" - Cache hit rate: {stats['hit_rate']:.2f}"
         log_to_file(log_message)
         
     except FileNotFoundError as e:
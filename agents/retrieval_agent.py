@@ -6,6 +6,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from typing import Any, Dict, List, Optional, Tuple
 from agents.embedding_agent import EmbeddingAgent
 from core.embedding_client import MockEmbeddingClient, GeminiEmbeddingClient
+from core.embedding_batcher import CoalescingEmbeddingClient
 from core.vector_store import InMemoryVectorStore
 from core.token_utils import log_tokens
 
@@ -14,7 +15,14 @@ class RetrievalAgent:
     Thin wrapper that:
       1) Creates embeddings for texts
       2) Stores them in a vector DB
-      3) Lets you query by semantic similarity
+      3) Lets you query by semantic similarity, BM25 keywords, or both fused
+
+    Hybrid search skips the embedding call entirely when BM25 alone is
+    confident about all k results: each scores >= lexical_min_score and the
+    k-th beats the next-ranked record by lexical_margin.
+
+    With coalesce_embeddings=True, query embeddings from concurrent search()
+    calls are micro-batched into shared API requests.
     """
 
     def __init__(
@@ -22,12 +30,25 @@ class RetrievalAgent:
         embed_agent: Optional[EmbeddingAgent] = None,
         vector_store: Optional[InMemoryVectorStore] = None,
         use_mock: bool = True,
+        fusion: str = "rrf",
+        alpha: float = 0.5,
+        lexical_fast_path: bool = True,
+        lexical_min_score: float = 1.0,
+        lexical_margin: float = 2.0,
+        coalesce_embeddings: bool = False,
     ):
         if embed_agent is None:
             client = MockEmbeddingClient() if use_mock else GeminiEmbeddingClient()
             embed_agent = EmbeddingAgent(client=client, model="mock-embedding" if use_mock else "text-embedding-004")
+        if coalesce_embeddings:
+            embed_agent = EmbeddingAgent(client=CoalescingEmbeddingClient(embed_agent.client), model=embed_agent.model)
         self.embed_agent = embed_agent
         self.vdb = vector_store or InMemoryVectorStore()
+        self.fusion = fusion
+        self.alpha = alpha
+        self.lexical_fast_path = lexical_fast_path
+        self.lexical_min_score = lexical_min_score
+        self.lexical_margin = lexical_margin
 
     def index(
         self,
@@ -41,12 +62,54 @@ class RetrievalAgent:
         self.vdb.upsert_embeddings(texts, vectors, metadatas)
         return self.vdb.count()
 
-    def search(self, query: str, k: int = 5) -> List[Tuple[float, Dict[str, Any]]]:
-        """Embed query and run cosine similarity search."""
+    def close(self) -> None:
+        """Release background resources held by the embedding client (e.g. coalescing threads)."""
+        close = getattr(self.embed_agent.client, "close", None)
+        if close is not None:
+            close()
+
+    def _lexically_confident(self, hits: List[Tuple[float, Dict[str, Any]]], wanted: int) -> bool:
+        """
+        Every one of the `wanted` hits must score >= lexical_min_score, and the
+        weakest of them must beat the next-ranked hit by lexical_margin.
+        """
+        if len(hits) < wanted or hits[wanted - 1][0] < self.lexical_min_score:
+            return False
+        if len(hits) == wanted:
+            return True
+        return hits[wanted - 1][0] >= self.lexical_margin * hits[wanted][0]
+
+    def _embed_query(self, query: str) -> List[float]:
         resp = self.embed_agent.embed([query])
         log_tokens(resp)
-        qvec = resp["embeddings"][0]
-        return self.vdb.similarity_search(qvec, k=k)
+        return resp["embeddings"][0]
+
+    def search(self, query: str, k: int = 5, mode: str = "vector") -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        mode="vector":  embed query and run cosine similarity search;
+                        scores are cosine similarities in [-1, 1]
+        mode="lexical": BM25 only, fully offline; scores are raw BM25 (>= 0,
+                        unbounded) and only records sharing a term are returned
+        mode="hybrid":  BM25 fast path if confident, else fuse vector + BM25;
+                        scores are BM25 on the fast path, otherwise the fused
+                        score (RRF ~1/60 per ranking, or weighted in [0, 1]).
+                        Only compare scores within a single call.
+        """
+        if mode == "lexical":
+            return self.vdb.lexical_search(query, k=k)
+        if mode == "vector":
+            return self.vdb.similarity_search(self._embed_query(query), k=k)
+        if mode != "hybrid":
+            raise ValueError(f"Unknown search mode: {mode}")
+
+        if self.lexical_fast_path:
+            wanted = min(max(1, k), self.vdb.count())
+            hits = self.vdb.lexical_search(query, k=wanted + 1)
+            if wanted and self._lexically_confident(hits, wanted):
+                return hits[:wanted]
+        return self.vdb.hybrid_search(
+            self._embed_query(query), query, k=k, fusion=self.fusion, alpha=self.alpha
+        )
 
 if __name__ == "__main__":
     agent = RetrievalAgent(use_mock=True)
@@ -61,6 +124,9 @@ if __name__ == "__main__":
             {"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}
         ]
     )
-    results = agent.search("Where is the Eiffel Tower?", k=2)
+    results = agent.search("Where is the Eiffel Tower?", k=2, mode="hybrid")
     for score, payload in results:
+        print(f"{score:.3f} :: {payload}")
+    # Keyword-heavy query: answered by the BM25 fast path, no embedding call
+    for score, payload in agent.search("Taj Mahal", k=1, mode="hybrid"):
         print(f"{score:.3f} :: {payload}")
\ No newline at end of file
@@ -1,35 +1,17 @@
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from agents.base_agent import BaseAgent
-import os
-
-try:
-    from PyPDF2 import PdfReader
-    PDF_SUPPORT = True
-except ImportError:
-    PDF_SUPPORT = False
+from core.file_loader import load_document
 
 class TutorAgent(BaseAgent):
-    def __init__(self, file_path=None, level="beginner", **kwargs):
+    def __init__(self, file_path=None, level="beginner", content=None, **kwargs):
         super().__init__(**kwargs)
         self.file_path = file_path
         self.level = level
-        self.content = self.load_file() if file_path else ""
+        self.content = content if content is not None else (self.load_file() if file_path else "")
 
     def load_file(self):
-        if not os.path.exists(self.file_path):
-            raise FileNotFoundError(f"File {self.file_path} not found")
-        if self.file_path.endswith('.pdf'):
-            if not PDF_SUPPORT:
-                raise ImportError("PyPDF2 is required to read PDF files. Please install it with: pip install PyPDF2")
-            reader = PdfReader(self.file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
-            return text
-        else:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        return load_document(self.file_path)
 
     def run(self):
         if not self.content:
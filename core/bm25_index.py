@@ -0,0 +1,120 @@
+import math
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"\w+(?:[.-]\w+)*")
+_COMPOUND_SPLIT_RE = re.compile(r"[.-]")
+# Scripts written without spaces between words (Han, kana, Hangul syllables)
+_CJK_RUN_RE = re.compile(r"([\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]+)")
+
+ENGLISH_STOPWORDS: FrozenSet[str] = frozenset("""
+a an and are as at be but by can do does for from has have how i if in into
+is it its of on or so that the their there these this to was were what when
+where which who why will with you your
+""".split())
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase and split text into Unicode word tokens (café, 日本語, ...).
+    Compounds like error codes (HTTP-429, v1.2) are emitted whole and then
+    as their parts, so both "http-429" and "429" match.
+    """
+    tokens = []
+    for tok in _TOKEN_RE.findall(text.lower()):
+        tokens.append(tok)
+        if "." in tok or "-" in tok:
+            tokens.extend(_COMPOUND_SPLIT_RE.split(tok))
+    return tokens
+
+
+class BM25Index:
+    """
+    Dependency-free Okapi BM25 inverted index.
+    Documents are addressed by their insertion position, so ids line up with
+    the records of the vector store the index is built alongside.
+    Statistics (df, average length) are read at query time, which keeps
+    add_documents() incremental: no rebuild is needed after new inserts.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, stopwords: Optional[FrozenSet[str]] = ENGLISH_STOPWORDS):
+        self.k1 = k1
+        self.b = b
+        self.stopwords = stopwords or frozenset()
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_lens: List[int] = []
+        self._total_len = 0
+
+    def add_documents(self, texts: List[str]) -> None:
+        for t in texts:
+            doc_id = len(self._doc_lens)
+            tokens = self.terms(t)
+            tf: Dict[str, int] = {}
+            for tok in tokens:
+                tf[tok] = tf.get(tok, 0) + 1
+            for tok, c in tf.items():
+                self._postings.setdefault(tok, {})[doc_id] = c
+            self._doc_lens.append(len(tokens))
+            self._total_len += len(tokens)
+
+    def terms(self, text: str) -> List[str]:
+        """
+        Index/query terms: tokens minus stopwords. Runs of CJK characters have
+        no word boundaries, so they become overlapping character bigrams
+        ("東京は日本" -> 東京, 京は, は日, 日本).
+        """
+        terms = []
+        for tok in tokenize(text):
+            if tok in self.stopwords:
+                continue
+            if not _CJK_RUN_RE.search(tok):
+                terms.append(tok)
+                continue
+            for piece in _CJK_RUN_RE.split(tok):
+                if not piece:
+                    continue
+                if not _CJK_RUN_RE.fullmatch(piece):
+                    terms.append(piece)
+                elif len(piece) == 1:
+                    terms.append(piece)
+                else:
+                    terms.extend(piece[i:i + 2] for i in range(len(piece) - 1))
+        return terms
+
+    def idf(self, term: str) -> float:
+        n = len(self._doc_lens)
+        df = len(self._postings.get(term, ()))
+        # BM25+ style floor keeps idf positive for very common terms
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[float, int]]:
+        """Return list of (score, doc_id) sorted by descending score."""
+        n = len(self._doc_lens)
+        if n == 0:
+            return []
+        avgdl = (self._total_len / n) or 1.0
+        scores: Dict[int, float] = {}
+        for term in set(self.terms(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for doc_id, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._doc_lens[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        results = sorted(((s, d) for d, s in scores.items()), key=lambda x: x[0], reverse=True)
+        return results[: max(1, k)]
+
+    def count(self) -> int:
+        return len(self._doc_lens)
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._doc_lens.clear()
+        self._total_len = 0
+
+if __name__ == "__main__":
+    idx = BM25Index()
+    idx.add_documents(["Error E1234 means the disk is full.", "Paris is the capital of France."])
+    idx.add_documents(["Restart after error E5678."])
+    print(idx.search("what is E1234?", k=2))  # Expect doc 0 first
@@ -0,0 +1,166 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.embedding_client import BaseEmbeddingClient
+
+class CoalescingEmbeddingClient(BaseEmbeddingClient):
+    """
+    Micro-batching front for another embedding client.
+
+    Concurrent embed() calls are queued; a background thread waits up to
+    max_wait_ms (or until max_batch_size texts are queued), sends them to the
+    wrapped client as one batch request and scatters the vectors back to the
+    callers. Identical texts already queued or in flight share one result
+    (single-flight), so N threads embedding the same query cost one slot.
+    Texts are only grouped with others sent with the same model and kwargs.
+    Call close() to flush the queue and stop the background threads.
+    """
+
+    def __init__(
+        self,
+        client: BaseEmbeddingClient,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 4,
+    ):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[Any, ...]] = []
+        self._inflight: Dict[Tuple[Any, ...], Future] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrent_batches)
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self.requested_texts = 0
+        self.deduplicated_texts = 0
+        self.batches = 0
+        self.batched_texts = 0
+
+    def embed(self, texts: List[str], model: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        opts = tuple(sorted(kwargs.items()))
+        futures = []
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("CoalescingEmbeddingClient is closed")
+            for t in texts:
+                key = (model, opts, t)
+                fut = self._inflight.get(key)
+                if fut is None:
+                    fut = Future()
+                    self._inflight[key] = fut
+                    self._pending.append(key)
+                else:
+                    self.deduplicated_texts += 1
+                futures.append(fut)
+            self.requested_texts += len(texts)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._collect_loop, daemon=True)
+                self._worker.start()
+            self._cond.notify()
+
+        results = [f.result() for f in futures]
+        usage = {"prompt_tokens": sum(len(t.split()) for t in texts), "embedding_tokens": len(texts)}
+        resp_model = results[0][0] if results else model
+        return {"model": resp_model, "embeddings": [vec for _, vec in results], "usage": usage}
+
+    def _collect_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                deadline = time.monotonic() + self.max_wait
+                while len(self._pending) < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                group = self._pending[0][:2]
+                batch = [k for k in self._pending if k[:2] == group][: self.max_batch_size]
+                taken = set(batch)
+                self._pending = [k for k in self._pending if k not in taken]
+                self.batches += 1
+                self.batched_texts += len(batch)
+            self._pool.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[Tuple[Any, ...]]) -> None:
+        model, opts = batch[0][:2]
+        kwargs = dict(opts)
+        if model is not None:
+            kwargs["model"] = model
+        # Keys stay in _inflight until resolved, so identical texts arriving
+        # during the round trip join this request instead of starting another
+        with self._cond:
+            futures = [self._inflight[k] for k in batch]
+        error: Optional[BaseException] = None
+        try:
+            resp = self.client.embed([k[2] for k in batch], **kwargs)
+            vectors = resp["embeddings"]
+            if len(vectors) != len(batch):
+                raise ValueError(f"Embedding client returned {len(vectors)} vectors for {len(batch)} texts")
+            for fut, vec in zip(futures, vectors):
+                fut.set_result((resp.get("model"), vec))
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            # Every caller blocks on its future, so none may be left unresolved
+            for fut in futures:
+                if not fut.done():
+                    fut.set_exception(error or RuntimeError("Embedding batch was not completed"))
+            with self._cond:
+                for k in batch:
+                    self._inflight.pop(k, None)
+
+    def close(self) -> None:
+        """Send any queued texts, then stop the collector thread and batch pool."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+        self._pool.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requested_texts": self.requested_texts,
+            "deduplicated_texts": self.deduplicated_texts,
+            "batches": self.batches,
+            "mean_batch_size": (self.batched_texts / self.batches) if self.batches else 0.0,
+        }
+
+if __name__ == "__main__":
+    from core.embedding_client import SimulatedEmbeddingClient
+    from core.fault_injection import FaultProfile
+
+    class RateLimitedClient(SimulatedEmbeddingClient):
+        # at most 4 API requests in flight, like a per-project concurrency limit
+        _slots = threading.Semaphore(4)
+
+        def embed(self, texts, model="mock-embedding", **kwargs):
+            with self._slots:
+                return super().embed(texts, model=model, **kwargs)
+
+    # each query is sent twice, back to back, as concurrent duplicates
+    queries = [f"query number {i // 2}" for i in range(300)]
+
+    def bench(client, label):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            list(pool.map(lambda q: client.embed([q]), queries))
+        wall = time.perf_counter() - start
+        print(f"{label}: {len(queries) / wall:.0f} queries/s")
+
+    profile = FaultProfile(latency_ms=50)
+    bench(RateLimitedClient(profile), "one request per query")
+    coalesced = CoalescingEmbeddingClient(RateLimitedClient(profile), max_wait_ms=5)
+    bench(coalesced, "coalesced")
+    print(coalesced.stats())
+    coalesced.close()
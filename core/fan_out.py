@@ -0,0 +1,26 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+def run_concurrently(
+    tasks: Dict[str, Callable[[], Any]],
+    max_workers: Optional[int] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run independent callables (typically agent.run) on a thread pool.
+    Model calls are network-bound, so wall time is close to the slowest task.
+    Returns {name: {"result": ..., "error": str | None, "seconds": float}} in
+    the order the tasks were given; one failing task does not cancel the rest.
+    """
+    def _timed(fn: Callable[[], Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return {"result": fn(), "error": None, "seconds": time.perf_counter() - start}
+        except Exception as e:
+            return {"result": None, "error": str(e), "seconds": time.perf_counter() - start}
+
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks)) as pool:
+        futures = {name: pool.submit(_timed, fn) for name, fn in tasks.items()}
+        return {name: fut.result() for name, fut in futures.items()}
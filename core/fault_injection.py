@@ -0,0 +1,142 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+class SimulatedAPIError(Exception):
+    """
+    Error raised by simulated backends. The message starts with the HTTP
+    status code, like the provider SDK's errors, so the existing
+    "429"/"quota" string checks (retry loop, CLI error handling) apply.
+    """
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{code} {message}")
+        self.code = code
+        self.message = message
+
+
+class FaultProfile:
+    """
+    Latency and failure model shared by the simulated clients and the local
+    stand-in server.
+
+    latency_dist: "constant" | "uniform" | "normal" | "lognormal" | "exponential"
+      constant:    always latency_ms
+      uniform:     latency_ms +/- latency_jitter_ms
+      normal:      mean latency_ms, std latency_jitter_ms (clipped at 0)
+      lognormal:   median latency_ms, sigma = latency_jitter_ms / latency_ms (long tail)
+      exponential: mean latency_ms
+    tokens_per_second: adds completion_tokens / tokens_per_second of generation time
+    rate_429 / rate_5xx / error_rate: per-request probability of a 429, a 503,
+      or a non-retryable 400
+    quota_rpm: requests allowed per rolling 60s window; extra requests get 429
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        latency_dist: str = "constant",
+        tokens_per_second: Optional[float] = None,
+        response_tokens: int = 64,
+        error_rate: float = 0.0,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        quota_rpm: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        if latency_dist not in ("constant", "uniform", "normal", "lognormal", "exponential"):
+            raise ValueError(f"Unknown latency distribution: {latency_dist}")
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.latency_dist = latency_dist
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.quota_rpm = quota_rpm
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window: deque = deque()
+
+    def sample_latency(self) -> float:
+        """Return one network latency sample in seconds."""
+        mu, jitter = self.latency_ms, self.latency_jitter_ms
+        with self._lock:
+            if self.latency_dist == "constant":
+                ms = mu
+            elif self.latency_dist == "uniform":
+                ms = self._rng.uniform(mu - jitter, mu + jitter)
+            elif self.latency_dist == "normal":
+                ms = self._rng.gauss(mu, jitter)
+            elif self.latency_dist == "lognormal":
+                sigma = (jitter / mu) if mu > 0 else 0.0
+                ms = mu * self._rng.lognormvariate(0.0, sigma)
+            else:
+                ms = self._rng.expovariate(1.0 / mu) if mu > 0 else 0.0
+        return max(0.0, ms) / 1000.0
+
+    def generation_time(self, completion_tokens: int) -> float:
+        if not self.tokens_per_second:
+            return 0.0
+        return completion_tokens / self.tokens_per_second
+
+    def _over_quota(self, now: float) -> bool:
+        if self.quota_rpm is None:
+            return False
+        while self._window and now - self._window[0] >= 60.0:
+            self._window.popleft()
+        if len(self._window) >= self.quota_rpm:
+            return True
+        self._window.append(now)
+        return False
+
+    def check_fault(self) -> None:
+        """Raise SimulatedAPIError if this request should fail."""
+        with self._lock:
+            if self._over_quota(time.monotonic()):
+                raise SimulatedAPIError(429, "Quota exceeded for quota metric 'Generate Content API requests per minute' (simulated)")
+            r = self._rng.random()
+        if r < self.rate_429:
+            raise SimulatedAPIError(429, "Resource has been exhausted (e.g. check quota). (simulated)")
+        if r < self.rate_429 + self.rate_5xx:
+            raise SimulatedAPIError(503, "The service is currently unavailable. (simulated)")
+        if r < self.rate_429 + self.rate_5xx + self.error_rate:
+            raise SimulatedAPIError(400, "Request contains an invalid argument. (simulated)")
+
+    def simulate(self, completion_tokens: int = 0) -> None:
+        """Sleep for network latency, possibly fail, then sleep for generation time."""
+        time.sleep(self.sample_latency())
+        self.check_fault()
+        time.sleep(self.generation_time(completion_tokens))
+
+    @classmethod
+    def add_arguments(cls, parser) -> None:
+        """Register the profile's knobs on an argparse parser."""
+        parser.add_argument('--latency-ms', type=float, default=200.0, help='Typical network latency per request')
+        parser.add_argument('--latency-jitter-ms', type=float, default=50.0, help='Latency spread (meaning depends on --latency-dist)')
+        parser.add_argument('--latency-dist', default='lognormal', choices=['constant', 'uniform', 'normal', 'lognormal', 'exponential'])
+        parser.add_argument('--tokens-per-second', type=float, default=None, help='Simulated generation speed')
+        parser.add_argument('--response-tokens', type=int, default=64, help='Tokens in each simulated reply')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of a non-retryable 400')
+        parser.add_argument('--rate-429', type=float, default=0.0, help='Probability of a 429')
+        parser.add_argument('--rate-5xx', type=float, default=0.0, help='Probability of a 503')
+        parser.add_argument('--quota-rpm', type=int, default=None, help='Requests allowed per minute before 429s')
+        parser.add_argument('--seed', type=int, default=None)
+
+    @classmethod
+    def from_args(cls, args) -> "FaultProfile":
+        return cls(
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.latency_jitter_ms,
+            latency_dist=args.latency_dist,
+            tokens_per_second=args.tokens_per_second,
+            response_tokens=args.response_tokens,
+            error_rate=args.error_rate,
+            rate_429=args.rate_429,
+            rate_5xx=args.rate_5xx,
+            quota_rpm=args.quota_rpm,
+            seed=args.seed,
+        )
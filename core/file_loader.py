@@ -0,0 +1,23 @@
+import os
+
+try:
+    from PyPDF2 import PdfReader
+    PDF_SUPPORT = True
+except ImportError:
+    PDF_SUPPORT = False
+
+def load_document(file_path: str) -> str:
+    """Read a PDF or text file and return its text content."""
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File {file_path} not found")
+    if file_path.endswith('.pdf'):
+        if not PDF_SUPPORT:
+            raise ImportError("PyPDF2 is required to read PDF files. Please install it with: pip install PyPDF2")
+        reader = PdfReader(file_path)
+        text = ""
+        for page in reader.pages:
+            text += page.extract_text()
+        return text
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
@@ -0,0 +1,129 @@
+import math
+import random
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+from core.bm25_index import tokenize
+
+class HashingVectorizer:
+    """
+    Stateless feature-hashing text vectorizer (pure Python, picklable).
+
+    Features are word n-grams and character n-grams of each word (with
+    boundary markers), hashed with CRC32 into `dim` signed buckets. Optional
+    IDF weights are applied per bucket, and an optional sparse random
+    projection (Achlioptas, `projection_nnz` nonzeros per bucket) maps the
+    hashed space to `projection_dim` dense dimensions. Output is L2-normalized.
+    """
+
+    def __init__(
+        self,
+        dim: int = 1024,
+        word_ngrams: Tuple[int, int] = (1, 2),
+        char_ngrams: Optional[Tuple[int, int]] = (3, 5),
+        projection_dim: Optional[int] = None,
+        projection_nnz: int = 3,
+        seed: int = 0,
+    ):
+        self.dim = dim
+        self.word_ngrams = word_ngrams
+        self.char_ngrams = char_ngrams
+        self.projection_dim = projection_dim
+        self.projection_nnz = projection_nnz
+        self.seed = seed
+        self._word_cache: Dict[str, List[Tuple[int, float]]] = {}
+        self._projection: Optional[List[List[Tuple[int, float]]]] = None
+
+    def __getstate__(self):
+        # Caches are rebuilt deterministically, so don't ship them to worker processes
+        state = self.__dict__.copy()
+        state["_word_cache"] = {}
+        state["_projection"] = None
+        return state
+
+    @property
+    def output_dim(self) -> int:
+        return self.projection_dim or self.dim
+
+    def _hash(self, feature: str) -> Tuple[int, float]:
+        h = zlib.crc32(feature.encode("utf-8"), self.seed)
+        return h % self.dim, (1.0 if h & 0x80000000 else -1.0)
+
+    def _word_features(self, word: str) -> List[Tuple[int, float]]:
+        # Unigram + char n-grams of a word never change, and words repeat a
+        # lot across a corpus, so they are hashed once and cached.
+        feats = self._word_cache.get(word)
+        if feats is not None:
+            return feats
+        feats = []
+        if self.word_ngrams[0] <= 1 <= self.word_ngrams[1]:
+            feats.append(self._hash("w " + word))
+        if self.char_ngrams:
+            padded = f"<{word}>"
+            lo, hi = self.char_ngrams
+            for n in range(lo, hi + 1):
+                for i in range(len(padded) - n + 1):
+                    feats.append(self._hash("c " + padded[i:i + n]))
+        if len(self._word_cache) > 200_000:
+            self._word_cache.clear()
+        self._word_cache[word] = feats
+        return feats
+
+    def sparse_features(self, text: str) -> Dict[int, float]:
+        """Return {bucket: signed count} for one text."""
+        tokens = tokenize(text)
+        counts: Dict[int, float] = {}
+        for tok in tokens:
+            for bucket, sign in self._word_features(tok):
+                counts[bucket] = counts.get(bucket, 0.0) + sign
+        lo, hi = self.word_ngrams
+        for n in range(max(2, lo), hi + 1):
+            for i in range(len(tokens) - n + 1):
+                bucket, sign = self._hash("w " + " ".join(tokens[i:i + n]))
+                counts[bucket] = counts.get(bucket, 0.0) + sign
+        return counts
+
+    def _projection_table(self) -> List[List[Tuple[int, float]]]:
+        if self._projection is None:
+            rng = random.Random(self.seed)
+            scale = 1.0 / math.sqrt(self.projection_nnz)
+            self._projection = [
+                [(rng.randrange(self.projection_dim), scale if rng.random() < 0.5 else -scale)
+                 for _ in range(self.projection_nnz)]
+                for _ in range(self.dim)
+            ]
+        return self._projection
+
+    def transform(self, texts: List[str], idf: Optional[List[float]] = None) -> List[List[float]]:
+        table = self._projection_table() if self.projection_dim else None
+        out_dim = self.output_dim
+        vectors = []
+        for text in texts:
+            feats = self.sparse_features(text)
+            if idf is not None:
+                feats = {bucket: value * idf[bucket] for bucket, value in feats.items()}
+            vec = [0.0] * out_dim
+            if table is None:
+                norm = math.sqrt(sum(x * x for x in feats.values())) or 1e-12
+                for bucket, value in feats.items():
+                    vec[bucket] = value / norm
+            else:
+                for bucket, value in feats.items():
+                    for j, w in table[bucket]:
+                        vec[j] += value * w
+                norm = math.sqrt(sum(x * x for x in vec)) or 1e-12
+                vec = [x / norm for x in vec]
+            vectors.append(vec)
+        return vectors
+
+
+# Per-process state for HashingEmbeddingClient's process pool
+_worker_vectorizer: Optional[HashingVectorizer] = None
+_worker_idf: Optional[List[float]] = None
+
+def _init_worker(vectorizer: HashingVectorizer, idf: Optional[List[float]]) -> None:
+    global _worker_vectorizer, _worker_idf
+    _worker_vectorizer, _worker_idf = vectorizer, idf
+
+def _transform_chunk(texts: List[str]) -> List[List[float]]:
+    return _worker_vectorizer.transform(texts, _worker_idf)
@@ -0,0 +1,116 @@
+"""
+Load-test driver: runs an agent many times concurrently against a simulated
+backend and reports throughput and latency percentiles.
+
+  backend "sim":    SimulatedModelClient in-process (no network)
+  backend "server": GeminiModelClient against the local stand-in server
+                    (core/mock_server.py); started automatically unless
+                    --endpoint points at a running one
+
+Example:
+  python -m core.load_test SummarizerAgent --file data/notes.md \\
+      --requests 100 --concurrency 16 --latency-ms 400 --rate-429 0.05
+"""
+import argparse
+import contextlib
+import io
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from core.fault_injection import FaultProfile
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list (p in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def run_load_test(task: Callable[[], Any], requests: int = 50, concurrency: int = 8) -> Dict[str, Any]:
+    """
+    Call task() `requests` times on `concurrency` threads.
+    Latencies cover successful calls only, including any retry/backoff time.
+    """
+    def _timed(_):
+        start = time.perf_counter()
+        try:
+            task()
+            return time.perf_counter() - start, None
+        except Exception as e:
+            return time.perf_counter() - start, str(e)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(_timed, range(requests)))
+    wall = time.perf_counter() - wall_start
+
+    latencies = sorted(t for t, err in outcomes if err is None)
+    errors = [err for _, err in outcomes if err is not None]
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "succeeded": len(latencies),
+        "failed": len(errors),
+        "wall_seconds": wall,
+        "throughput_rps": len(latencies) / wall if wall else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "sample_errors": errors[:3],
+    }
+
+def format_report(stats: Dict[str, Any]) -> str:
+    lines = [
+        f"Requests:    {stats['requests']} ({stats['succeeded']} ok, {stats['failed']} failed) at concurrency {stats['concurrency']}",
+        f"Wall time:   {stats['wall_seconds']:.2f}s",
+        f"Throughput:  {stats['throughput_rps']:.2f} req/s",
+        f"Latency:     p50 {stats['p50_ms']:.0f} ms | p95 {stats['p95_ms']:.0f} ms | p99 {stats['p99_ms']:.0f} ms",
+    ]
+    for err in stats["sample_errors"]:
+        lines.append(f"Error:       {err[:120]}")
+    return "\n".join(lines)
+
+def main():
+    from agentcli import get_agent_class
+    from core.file_loader import load_document
+    from core.model_client import GeminiModelClient, SimulatedModelClient
+    from core.mock_server import start_server
+
+    parser = argparse.ArgumentParser(description="Load-test an agent against a simulated backend")
+    parser.add_argument('agent_name', help='Agent to run (SummarizerAgent, ReminderAgent, TutorAgent)')
+    parser.add_argument('--file', required=True, help='Document the agent runs on')
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--backend', choices=['sim', 'server'], default='sim')
+    parser.add_argument('--endpoint', help='Running stand-in server, e.g. http://127.0.0.1:8765')
+    parser.add_argument('--backoff-base', type=float, default=1.0, help='Retry backoff scale (1.0 = 1s, 2s, 4s, ...)')
+    parser.add_argument('--verbose', action='store_true', help='Show per-call token and retry logging')
+    FaultProfile.add_arguments(parser)
+    args = parser.parse_args()
+
+    profile = FaultProfile.from_args(args)
+    server = None
+    if args.backend == 'sim':
+        client = SimulatedModelClient(profile, backoff_base=args.backoff_base)
+    else:
+        endpoint = args.endpoint
+        if not endpoint:
+            server = start_server(profile, port=0)
+            endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+        client = GeminiModelClient(api_key="local", api_endpoint=endpoint, backoff_base=args.backoff_base)
+
+    content = load_document(args.file)
+    agent_class = get_agent_class(args.agent_name)
+    agent = agent_class(file_path=args.file, content=content, client=client)
+
+    sink = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with sink:
+        stats = run_load_test(agent.run, requests=args.requests, concurrency=args.concurrency)
+    if server:
+        server.shutdown()
+    print(format_report(stats))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Local stand-in for the Gemini REST API, for load testing without quota.
+
+Serves:
+  POST /{version}/models/{model}:generateContent
+  POST /{version}/models/{model}:embedContent
+  POST /{version}/models/{model}:batchEmbedContents
+
+Each request is delayed and failed according to a FaultProfile. Point the
+real clients at it with api_endpoint, e.g.
+  GeminiModelClient(api_key="local", api_endpoint="http://127.0.0.1:8765")
+which exercises the SDK and GeminiModelClient's retry/backoff path.
+The endpoint is set via the process-global genai.configure, so every
+Gemini client in that process is redirected, not just the one built here.
+
+Run: python -m core.mock_server --port 8765 --latency-ms 300 --rate-429 0.1
+"""
+import argparse
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from core.embedding_client import MockEmbeddingClient
+from core.fault_injection import FaultProfile, SimulatedAPIError
+
+_ROUTE_RE = re.compile(r"^/(?P<version>v1(?:beta)?)/models/(?P<model>[^:/]+):(?P<method>\w+)$")
+_ERROR_STATUS = {400: "INVALID_ARGUMENT", 429: "RESOURCE_EXHAUSTED", 503: "UNAVAILABLE"}
+
+
+class MockGeminiHandler(BaseHTTPRequestHandler):
+    server_version = "MockGemini/1.0"
+    profile: FaultProfile = FaultProfile()
+
+    def log_message(self, format, *args):
+        pass  # keep load tests quiet
+
+    def _send_json(self, code: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, code: int, message: str) -> None:
+        self._send_json(code, {"error": {"code": code, "message": message, "status": _ERROR_STATUS.get(code, "INTERNAL")}})
+
+    def do_POST(self):
+        path = self.path.split("?", 1)[0]
+        match = _ROUTE_RE.match(path)
+        if not match:
+            self._send_error(404, f"Unknown path {path}")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_error(400, "Invalid JSON payload")
+            return
+
+        model, method = match.group("model"), match.group("method")
+        try:
+            if method == "generateContent":
+                status, payload = self._generate(body)
+            elif method == "embedContent":
+                self.profile.simulate()
+                vec = MockEmbeddingClient().embed([_content_text(body.get("content"))])["embeddings"][0]
+                status, payload = 200, {"embedding": {"values": vec}}
+            elif method == "batchEmbedContents":
+                self.profile.simulate()
+                texts = [_content_text(r.get("content")) for r in body.get("requests", [])]
+                vecs = MockEmbeddingClient().embed(texts)["embeddings"]
+                status, payload = 200, {"embeddings": [{"values": v} for v in vecs]}
+            else:
+                status, payload = 404, None
+        except SimulatedAPIError as e:
+            self._send_error(e.code, e.message)
+            return
+        if payload is None:
+            self._send_error(404, f"Unknown method {model}:{method}")
+            return
+        self._send_json(status, payload)
+
+    def _generate(self, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        n = self.profile.response_tokens
+        self.profile.simulate(completion_tokens=n)
+        prompt = " ".join(_content_text(c) for c in body.get("contents", []))
+        prompt_tokens = max(1, len(prompt.split()))
+        return 200, {
+            "candidates": [{
+                "content": {"parts": [{"text": " ".join(["lorem"] * n)}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {
+                "promptTokenCount": prompt_tokens,
+                "candidatesTokenCount": n,
+                "totalTokenCount": prompt_tokens + n,
+            },
+        }
+
+
+def _content_text(content: Optional[Dict[str, Any]]) -> str:
+    if not content:
+        return ""
+    return " ".join(p.get("text", "") for p in content.get("parts", []))
+
+
+def make_server(profile: Optional[FaultProfile] = None, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    handler = type("ProfiledMockGeminiHandler", (MockGeminiHandler,), {"profile": profile or FaultProfile()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def start_server(profile: Optional[FaultProfile] = None, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """Start the stand-in server on a daemon thread and return it (call .shutdown() to stop)."""
+    server = make_server(profile, host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Gemini API stand-in with injected latency and faults")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    FaultProfile.add_arguments(parser)
+    args = parser.parse_args()
+
+    server = make_server(FaultProfile.from_args(args), args.host, args.port)
+    print(f"Mock Gemini API listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from core.similarity_utils import cosine_similarity
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class SemanticCache:
+    """
+    Answer cache keyed by (file content hash, question meaning).
+    Questions are embedded with an EmbeddingAgent; a lookup returns the stored
+    answer of the most similar prior question on the same content if the
+    cosine similarity is >= threshold.
+    Eviction: entries older than ttl_seconds expire, and the least recently
+    used entry is dropped once max_entries is exceeded.
+    If path is given the cache (entries and hit/miss counters) is persisted as
+    JSON, so separate CLI invocations share it.
+    """
+
+    def __init__(
+        self,
+        embed_agent=None,
+        threshold: float = 0.9,
+        max_entries: int = 256,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        path: Optional[str] = None,
+    ):
+        if embed_agent is None:
+            from agents.embedding_agent import EmbeddingAgent
+            embed_agent = EmbeddingAgent()
+        self.embed_agent = embed_agent
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path and os.path.exists(path):
+            self.load()
+
+    def embed(self, question: str) -> List[float]:
+        vec = self.embed_agent.embed([question])["embeddings"][0]
+        norm = math.sqrt(sum(x * x for x in vec)) or 1e-12
+        return [x / norm for x in vec]
+
+    def _expire(self, now: float) -> None:
+        if self.ttl_seconds is None:
+            return
+        expired = [eid for eid, e in self._entries.items() if now - e["created"] > self.ttl_seconds]
+        for eid in expired:
+            del self._entries[eid]
+        self.evictions += len(expired)
+
+    def lookup(self, content_hash: str, question: str, vector: Optional[List[float]] = None) -> Optional[str]:
+        """Return a cached answer or None. Counts a hit or a miss."""
+        vector = vector or self.embed(question)
+        with self._lock:
+            self._expire(time.time())
+            best_id, best_score = None, -1.0
+            for eid, e in self._entries.items():
+                if e["content_hash"] != content_hash or len(e["vector"]) != len(vector):
+                    continue
+                score = cosine_similarity(vector, e["vector"])
+                if score > best_score:
+                    best_id, best_score = eid, score
+            if best_id is not None and best_score >= self.threshold:
+                self._entries.move_to_end(best_id)
+                self.hits += 1
+                return self._entries[best_id]["answer"]
+            self.misses += 1
+            return None
+
+    def store(self, content_hash: str, question: str, answer: str, vector: Optional[List[float]] = None) -> None:
+        vector = vector or self.embed(question)
+        with self._lock:
+            self._entries[uuid.uuid4().hex] = {
+                "content_hash": content_hash,
+                "question": question,
+                "answer": answer,
+                "vector": vector,
+                "created": time.time(),
+            }
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_generate(self, content_hash: str, question: str, generate: Callable[[], str]) -> str:
+        """
+        Return a cached answer, or call generate() on a miss and cache its result.
+        If embedding the question fails the cache is bypassed and the model answers.
+        """
+        try:
+            vector = self.embed(question)
+            answer = self.lookup(content_hash, question, vector=vector)
+        except Exception:
+            with self._lock:
+                self.misses += 1
+            return generate()
+        if answer is None:
+            answer = generate()
+            self.store(content_hash, question, answer, vector=vector)
+        if self.path:
+            try:
+                self.save()
+            except OSError:
+                pass  # a failed write only costs future hits
+        return answer
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+        }
+
+    def save(self) -> None:
+        with self._lock:
+            data = {
+                "entries": list(self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # Write a temp file and swap it in, so concurrent CLI runs never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".semantic_cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self) -> None:
+        """Load a saved cache; an unreadable or corrupt file yields an empty cache."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("cache file is not a JSON object")
+        except (OSError, ValueError):
+            data = {}
+        with self._lock:
+            self._entries = OrderedDict((uuid.uuid4().hex, e) for e in data.get("entries", []))
+            self.hits = data.get("hits", 0)
+            self.misses = data.get("misses", 0)
+            self.evictions = data.get("evictions", 0)
+            self._expire(time.time())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+if __name__ == "__main__":
+    from agents.embedding_agent import EmbeddingAgent
+    from core.embedding_client import MockEmbeddingClient
+
+    cache = SemanticCache(embed_agent=EmbeddingAgent(client=MockEmbeddingClient(), model="mock-embedding"))
+    h = content_hash("some document")
+    print(cache.get_or_generate(h, "When is the deadline?", lambda: "Friday"))
+    print(cache.get_or_generate(h, "When is the deadline?", lambda: "model was called"))  # Expect cached "Friday"
+    print(cache.stats())
@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 import math
 from core.similarity_utils import cosine_similarity, l2_distance, dot_product_similarity
+from core.bm25_index import BM25Index
 
 class BaseVectorStore:
     def upsert_embeddings(
@@ -30,11 +31,14 @@ class InMemoryVectorStore(BaseVectorStore):
     """
     Simple, dependency-light in-memory vector DB using cosine similarity.
     Stores: vectors, texts, and optional metadata per record.
+    A BM25 index over the texts is maintained alongside the vectors for
+    lexical and hybrid search.
     """
 
     def __init__(self, normalize: bool = True):
         self._records: List[Dict[str, Any]] = []
         self._normalize = normalize
+        self._lexical = BM25Index()
 
     def _normalize_vec(self, v: List[float]) -> List[float]:
         if not self._normalize:
@@ -60,19 +64,16 @@ class InMemoryVectorStore(BaseVectorStore):
                 "metadata": (metadatas[i] if metadatas else {}),
             }
             self._records.append(rec)
+        self._lexical.add_documents(texts)
 
-    def similarity_search(
-        self,
-        query_embedding: List[float],
-        k: int = 5,
-        metric: str = "cosine",
-    ) -> List[Tuple[float, Dict[str, Any]]]:
-        if not self._records:
-            return []
-        q = self._normalize_vec(query_embedding)
+    def _payload(self, idx: int) -> Dict[str, Any]:
+        rec = self._records[idx]
+        return {"text": rec["text"], "metadata": rec["metadata"]}
 
-        results: List[Tuple[float, Dict[str, Any]]] = []
-        for rec in self._records:
+    def _vector_ranking(self, query_embedding: List[float], metric: str) -> List[Tuple[float, int]]:
+        q = self._normalize_vec(query_embedding)
+        results: List[Tuple[float, int]] = []
+        for i, rec in enumerate(self._records):
             v = rec["vector"]
             if metric == "cosine":
                 score = cosine_similarity(q, v)
@@ -82,14 +83,69 @@ class InMemoryVectorStore(BaseVectorStore):
                 score = dot_product_similarity(q, v)
             else:
                 raise ValueError(f"Unknown metric: {metric}")
-            payload = {"text": rec["text"], "metadata": rec["metadata"]}
-            results.append((float(score), payload))
-
+            results.append((float(score), i))
         results.sort(key=lambda x: x[0], reverse=True)
-        return results[: max(1, k)]
+        return results
+
+    def similarity_search(
+        self,
+        query_embedding: List[float],
+        k: int = 5,
+        metric: str = "cosine",
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        if not self._records:
+            return []
+        ranked = self._vector_ranking(query_embedding, metric)
+        return [(score, self._payload(i)) for score, i in ranked[: max(1, k)]]
+
+    def lexical_search(self, query: str, k: int = 5) -> List[Tuple[float, Dict[str, Any]]]:
+        """BM25 keyword search. Returns (bm25_score, payload); no embedding needed."""
+        return [(score, self._payload(i)) for score, i in self._lexical.search(query, k=k)]
+
+    def hybrid_search(
+        self,
+        query_embedding: List[float],
+        query: str,
+        k: int = 5,
+        fusion: str = "rrf",
+        alpha: float = 0.5,
+        rrf_k: int = 60,
+        metric: str = "cosine",
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Fuse vector and BM25 rankings.
+          fusion="rrf":      score = sum(1 / (rrf_k + rank)) over both rankings
+          fusion="weighted": score = alpha * vec_score + (1 - alpha) * bm25_score,
+                             each min-max normalized to [0, 1]
+        """
+        if not self._records:
+            return []
+        vec_ranked = self._vector_ranking(query_embedding, metric)
+        lex_ranked = self._lexical.search(query, k=len(self._records))
+
+        fused: Dict[int, float] = {}
+        if fusion == "rrf":
+            for ranked in (vec_ranked, lex_ranked):
+                for rank, (_, i) in enumerate(ranked, start=1):
+                    fused[i] = fused.get(i, 0.0) + 1.0 / (rrf_k + rank)
+        elif fusion == "weighted":
+            for weight, ranked in ((alpha, vec_ranked), (1 - alpha, lex_ranked)):
+                if not ranked:
+                    continue
+                # BM25 scores are >= 0 and only cover matching docs, so anchor them at 0
+                hi, lo = ranked[0][0], (ranked[-1][0] if ranked is vec_ranked else 0.0)
+                for score, i in ranked:
+                    norm = (score - lo) / (hi - lo) if hi != lo else 1.0
+                    fused[i] = fused.get(i, 0.0) + weight * norm
+        else:
+            raise ValueError(f"Unknown fusion: {fusion}")
+
+        results = sorted(fused.items(), key=lambda x: x[1], reverse=True)
+        return [(float(score), self._payload(i)) for i, score in results[: max(1, k)]]
 
     def count(self) -> int:
         return len(self._records)
 
     def clear(self) -> None:
-        self._records.clear()
\ No newline at end of file
+        self._records.clear()
+        self._lexical.clear()
\ No newline at end of file